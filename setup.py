@@ -28,12 +28,14 @@ setup(
     install_requires=[
         "pydantic>=2.0",
         "click>=8.0",
+        "orjson>=3.8",
         "python-dotenv>=0.19.0",
     ],
     extras_require={
         "dev": [
             "pytest>=7.0",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.0",
             "black>=22.0",
             "flake8>=5.0",
             "mypy>=0.990",
@@ -4,11 +4,27 @@ Handles subprocess execution and response parsing
 """
 import subprocess
 import asyncio
+import codecs
+import os
+import re
+import shutil
+import signal
 import time
 from abc import ABC, abstractmethod
 from src.models import AgentConfig, AgentResponse
 
 
+# Matches whole lines mentioning credentials (e.g. "Loaded cached credentials")
+# that the Gemini CLI prints before the actual response
+_CRED_RE = re.compile(r'(?im)^.*credentials.*(?:\r?\n|$)')
+
+# Resolve CLI binaries to absolute paths once at import so each spawn
+# skips the PATH scan; fall back to the bare name if not found so the
+# missing-CLI error path still reports sensibly
+_CLAUDE_BIN = shutil.which("claude") or "claude"
+_GEMINI_BIN = shutil.which("gemini") or "gemini"
+
+
 class Agent(ABC):
     """Abstract base class for all agents"""
 
@@ -34,44 +50,152 @@ class Agent(ABC):
         Execute subprocess command asynchronously
         Returns: (stdout, stderr, execution_time_ms)
         """
-        start_time = time.time()
+        # perf_counter_ns is monotonic, so wall-clock adjustments (NTP)
+        # can never produce negative or skewed execution times
+        start_ns = time.perf_counter_ns()
 
         try:
             # Run subprocess with timeout
+            # start_new_session puts the CLI in its own process group so a
+            # timeout kill also reaps any children it spawned (otherwise an
+            # orphaned child keeps the output pipes open and wait() hangs)
+            # stderr goes to devnull: nothing downstream reads it, so piping
+            # it would only copy bytes into Python to be thrown away
             process = await asyncio.create_subprocess_exec(
                 *command,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.DEVNULL,
+                start_new_session=True
             )
 
+            # Per-attempt timeout: LLM latency has a fat tail, so a tighter
+            # request timeout plus retries beats one long wall-clock limit
+            timeout = self.config.request_timeout_seconds or self.config.timeout_seconds
+
+            # Read stdout in chunks instead of buffering the full output in
+            # communicate(); the timeout is checked between chunks against a
+            # single deadline so total wall time stays bounded
+            buffer = bytearray()
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=self.config.timeout_seconds
-                )
+                while True:
+                    remaining = timeout - (time.perf_counter_ns() - start_ns) / 1e9
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    chunk = await asyncio.wait_for(
+                        process.stdout.read(65536),
+                        timeout=remaining
+                    )
+                    if not chunk:
+                        break
+                    buffer += chunk
+
+                # The CLI closing stdout does not guarantee it exits; give
+                # the final wait the same deadline as the read loop so a
+                # lingering process cannot hang us past the timeout
+                remaining = timeout - (time.perf_counter_ns() - start_ns) / 1e9
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(process.wait(), timeout=remaining)
             except asyncio.TimeoutError:
-                process.kill()
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
                 await process.wait()
-                execution_time = (time.time() - start_time) * 1000
                 raise TimeoutError(
-                    f"Agent {self.config.name} timed out after {self.config.timeout_seconds}s"
+                    f"Agent {self.config.name} timed out after {timeout}s"
                 )
 
-            execution_time = (time.time() - start_time) * 1000
-            stdout_str = stdout.decode('utf-8', errors='replace')
-            stderr_str = stderr.decode('utf-8', errors='replace')
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e6
+            stdout_str = bytes(buffer).decode('utf-8', errors='replace')
 
-            return stdout_str, stderr_str, execution_time
+            # stderr slot kept for signature compatibility with callers
+            return stdout_str, "", execution_time
 
         except FileNotFoundError:
-            execution_time = (time.time() - start_time) * 1000
             raise RuntimeError(f"CLI command not found: {command[0]}")
 
+    async def execute_stream(self, prompt: str):
+        """
+        Async generator yielding response text chunks as the CLI emits them
+        Lets callers start consuming output before the run finishes (e.g.
+        progressive display); raises TimeoutError/RuntimeError like the
+        non-streaming path instead of returning an error response.
+        """
+        command = self._build_command(prompt)
+        start_ns = time.perf_counter_ns()
+        timeout = self.config.request_timeout_seconds or self.config.timeout_seconds
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except FileNotFoundError:
+            raise RuntimeError(f"CLI command not found: {command[0]}")
+
+        # Incremental decoder so a multi-byte character split across
+        # chunk boundaries never yields garbage
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        try:
+            while True:
+                remaining = timeout - (time.perf_counter_ns() - start_ns) / 1e9
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                chunk = await asyncio.wait_for(
+                    process.stdout.read(65536),
+                    timeout=remaining
+                )
+                if not chunk:
+                    break
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+            # Same deadline on the final wait as the read loop; stdout EOF
+            # alone does not prove the process exited
+            remaining = timeout - (time.perf_counter_ns() - start_ns) / 1e9
+            if remaining <= 0:
+                raise asyncio.TimeoutError
+            await asyncio.wait_for(process.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            raise TimeoutError(
+                f"Agent {self.config.name} timed out after {timeout}s"
+            )
+
+    async def _execute_with_retries(self, command: list) -> tuple[str, str, float]:
+        """
+        Run the subprocess, retrying timed-out attempts with exponential backoff
+        The killed process is respawned fresh on each attempt
+        """
+        start_ns = time.perf_counter_ns()
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                return await self._execute_subprocess(command)
+            except TimeoutError as error:
+                if attempt == self.config.max_retries:
+                    # Attach the real wall time spent (all attempts plus
+                    # backoff sleeps) so the error response reports what
+                    # actually elapsed, not the configured timeout
+                    error.elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                    raise
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
     def _parse_response(self, stdout: str, stderr: str, execution_time_ms: float) -> AgentResponse:
         """Parse CLI output into AgentResponse"""
         response_text = stdout.strip() if stdout else ""
 
-        return AgentResponse(
+        return AgentResponse.model_construct(
             agent_name=self.config.name,
             role=self.config.role,
             model_provider=self.config.model_provider,
@@ -82,6 +206,20 @@ class Agent(ABC):
             error_message=None
         )
 
+    def _error_response(self, error: Exception, elapsed_ms: float) -> AgentResponse:
+        """Build a failed AgentResponse for an execution error"""
+        config = self.config
+        return AgentResponse.model_construct(
+            agent_name=config.name,
+            role=config.role,
+            model_provider=config.model_provider,
+            model_name=config.model_name,
+            response_text="",
+            execution_time_ms=elapsed_ms,
+            success=False,
+            error_message=str(error)
+        )
+
 
 class ClaudeAgent(Agent):
     """Claude CLI agent implementation"""
@@ -89,7 +227,7 @@ class ClaudeAgent(Agent):
     def _build_command(self, prompt: str) -> list:
         """Build claude CLI command"""
         return [
-            "claude",
+            _CLAUDE_BIN,
             "--model", self.config.model_id,
             "--print", prompt
         ]
@@ -98,32 +236,16 @@ class ClaudeAgent(Agent):
         """Execute Claude agent"""
         try:
             command = self._build_command(prompt)
-            stdout, stderr, execution_time = await self._execute_subprocess(command)
+            stdout, stderr, execution_time = await self._execute_with_retries(command)
             return self._parse_response(stdout, stderr, execution_time)
 
         except TimeoutError as e:
-            return AgentResponse(
-                agent_name=self.config.name,
-                role=self.config.role,
-                model_provider=self.config.model_provider,
-                model_name=self.config.model_name,
-                response_text="",
-                execution_time_ms=self.config.timeout_seconds * 1000,
-                success=False,
-                error_message=str(e)
+            return self._error_response(
+                e, getattr(e, "elapsed_ms", self.config.timeout_seconds * 1000)
             )
 
         except Exception as e:
-            return AgentResponse(
-                agent_name=self.config.name,
-                role=self.config.role,
-                model_provider=self.config.model_provider,
-                model_name=self.config.model_name,
-                response_text="",
-                execution_time_ms=0,
-                success=False,
-                error_message=str(e)
-            )
+            return self._error_response(e, 0)
 
 
 class GeminiAgent(Agent):
@@ -132,7 +254,7 @@ class GeminiAgent(Agent):
     def _build_command(self, prompt: str) -> list:
         """Build gemini CLI command"""
         return [
-            "gemini",
+            _GEMINI_BIN,
             "--yolo",
             "-m", self.config.model_id,
             prompt
@@ -140,19 +262,13 @@ class GeminiAgent(Agent):
 
     def _clean_gemini_output(self, text: str) -> str:
         """Remove credential lines from Gemini output"""
-        lines = text.split('\n')
-        cleaned_lines = [
-            line for line in lines
-            if "Loaded cached credentials" not in line
-            and "credentials" not in line.lower()
-        ]
-        return '\n'.join(cleaned_lines).strip()
+        return _CRED_RE.sub('', text).strip()
 
     def _parse_response(self, stdout: str, stderr: str, execution_time_ms: float) -> AgentResponse:
         """Parse Gemini CLI output, removing credential messages"""
         response_text = self._clean_gemini_output(stdout) if stdout else ""
 
-        return AgentResponse(
+        return AgentResponse.model_construct(
             agent_name=self.config.name,
             role=self.config.role,
             model_provider=self.config.model_provider,
@@ -167,39 +283,98 @@ class GeminiAgent(Agent):
         """Execute Gemini agent"""
         try:
             command = self._build_command(prompt)
-            stdout, stderr, execution_time = await self._execute_subprocess(command)
+            stdout, stderr, execution_time = await self._execute_with_retries(command)
             return self._parse_response(stdout, stderr, execution_time)
 
         except TimeoutError as e:
-            return AgentResponse(
-                agent_name=self.config.name,
-                role=self.config.role,
-                model_provider=self.config.model_provider,
-                model_name=self.config.model_name,
-                response_text="",
-                execution_time_ms=self.config.timeout_seconds * 1000,
-                success=False,
-                error_message=str(e)
+            return self._error_response(
+                e, getattr(e, "elapsed_ms", self.config.timeout_seconds * 1000)
             )
 
         except Exception as e:
-            return AgentResponse(
-                agent_name=self.config.name,
-                role=self.config.role,
-                model_provider=self.config.model_provider,
-                model_name=self.config.model_name,
-                response_text="",
-                execution_time_ms=0,
-                success=False,
-                error_message=str(e)
-            )
+            return self._error_response(e, 0)
+
+
+# Provider name -> agent class; additional providers can register here
+# without touching the factory
+_AGENT_CLASSES: dict[str, type[Agent]] = {
+    "claude": ClaudeAgent,
+    "gemini": GeminiAgent,
+}
+
+_PROVIDER_BINS: dict[str, str] = {
+    "claude": _CLAUDE_BIN,
+    "gemini": _GEMINI_BIN,
+}
+
+
+async def warm_provider_cli(provider: str) -> bool:
+    """Warm a provider CLI with a throwaway --version call
+
+    The first CLI launch of a session pays cold-start costs (runtime
+    init, credential refresh, on-disk caches) that would otherwise land
+    on the first real prompt. Best-effort: returns False for unknown
+    providers or missing binaries instead of raising.
+    """
+    binary = _PROVIDER_BINS.get(provider)
+    if binary is None:
+        return False
+    try:
+        process = await asyncio.create_subprocess_exec(
+            binary, "--version",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await process.wait() == 0
+    except (FileNotFoundError, OSError):
+        return False
 
 
 def create_agent(config: AgentConfig) -> Agent:
     """Factory function to create agents based on config"""
-    if config.model_provider == "claude":
-        return ClaudeAgent(config)
-    elif config.model_provider == "gemini":
-        return GeminiAgent(config)
-    else:
+    agent_class = _AGENT_CLASSES.get(config.model_provider)
+    if agent_class is None:
         raise ValueError(f"Unknown provider: {config.model_provider}")
+    return agent_class(config)
+
+
+async def execute_agents_parallel(
+    agents_and_prompts: list[tuple[Agent, str]],
+    execute=None,
+) -> list[AgentResponse]:
+    """
+    Execute independent agents concurrently with asyncio.gather
+    Agent executions are I/O-bound subprocess calls, so overlapping them
+    cuts wall-clock time to the slowest agent instead of the sum.
+    Returns responses in the same order as the input pairs.
+
+    execute lets callers route each (agent, prompt) pair through their
+    own wrapper (e.g. the orchestrator's caching path) while keeping the
+    gather-and-convert error handling here.
+    """
+    if execute is None:
+        execute = lambda agent, prompt: agent.execute(prompt)
+    results = await asyncio.gather(
+        *(execute(agent, prompt) for agent, prompt in agents_and_prompts),
+        return_exceptions=True
+    )
+
+    responses = []
+    for (agent, _), result in zip(agents_and_prompts, results):
+        if isinstance(result, BaseException):
+            # Agent.execute normally catches its own errors; this is a
+            # safety net so one failed agent never poisons the batch
+            responses.append(AgentResponse.model_construct(
+                agent_name=agent.config.name,
+                role=agent.config.role,
+                model_provider=agent.config.model_provider,
+                model_name=agent.config.model_name,
+                response_text="",
+                execution_time_ms=0,
+                success=False,
+                error_message=str(result)
+            ))
+        else:
+            responses.append(result)
+
+    return responses
@@ -3,8 +3,6 @@ CLI interface using Click framework
 Provides commands for running and managing debates
 """
 import click
-import asyncio
-import os
 from src.models import DebateTopic, AgentConfig
 from src.orchestrator import DebateOrchestrator
 from src.utils import format_debate_for_display, format_debate_as_markdown, format_debates_list
@@ -17,6 +15,86 @@ def cli_group():
     pass
 
 
+# Lazily-built shared orchestrator so repeated command invocations in the
+# same process (batch runs, tests) reuse one storage backend
+_orchestrator_singleton: DebateOrchestrator | None = None
+
+
+def _get_orchestrator() -> DebateOrchestrator:
+    """Return the shared DebateOrchestrator, creating it on first use"""
+    global _orchestrator_singleton
+    if _orchestrator_singleton is None:
+        _orchestrator_singleton = DebateOrchestrator()
+    return _orchestrator_singleton
+
+
+def _build_agents_config(provider):
+    """Build the standard 3-agent configuration for a provider choice"""
+    if provider == 'claude':
+        return [
+            AgentConfig(
+                name="Claude FOR",
+                role="FOR",
+                model_provider="claude",
+                model_name="haiku"
+            ),
+            AgentConfig(
+                name="Claude AGAINST",
+                role="AGAINST",
+                model_provider="claude",
+                model_name="haiku"
+            ),
+            AgentConfig(
+                name="Claude SYNTHESIS",
+                role="SYNTHESIS",
+                model_provider="claude",
+                model_name="haiku"
+            ),
+        ]
+    elif provider == 'gemini':
+        return [
+            AgentConfig(
+                name="Gemini FOR",
+                role="FOR",
+                model_provider="gemini",
+                model_name="flash"
+            ),
+            AgentConfig(
+                name="Gemini AGAINST",
+                role="AGAINST",
+                model_provider="gemini",
+                model_name="flash"
+            ),
+            AgentConfig(
+                name="Gemini SYNTHESIS",
+                role="SYNTHESIS",
+                model_provider="gemini",
+                model_name="flash"
+            ),
+        ]
+    else:  # mixed
+        return [
+            AgentConfig(
+                name="Claude FOR",
+                role="FOR",
+                model_provider="claude",
+                model_name="haiku"
+            ),
+            AgentConfig(
+                name="Gemini AGAINST",
+                role="AGAINST",
+                model_provider="gemini",
+                model_name="flash"
+            ),
+            AgentConfig(
+                name="Claude SYNTHESIS",
+                role="SYNTHESIS",
+                model_provider="claude",
+                model_name="haiku"
+            ),
+        ]
+
+
 @cli_group.command(name='debate')
 @click.option('--topic', required=True, help='Debate topic title')
 @click.option('--description', required=True, help='Debate topic description')
@@ -24,6 +102,8 @@ def cli_group():
 @click.option('--output', default=None, help='Output file for debate results (optional)')
 def debate_command(topic, description, provider, output):
     """Run a debate on the given topic"""
+    import asyncio
+
     click.echo(f"\n🔄 Starting debate: {topic}")
     click.echo(f"   Description: {description}")
     click.echo(f"   Provider: {provider}\n")
@@ -36,73 +116,12 @@ def debate_command(topic, description, provider, output):
         )
 
         # Define agents based on selected provider
-        if provider == 'claude':
-            agents_config = [
-                AgentConfig(
-                    name="Claude FOR",
-                    role="FOR",
-                    model_provider="claude",
-                    model_name="haiku"
-                ),
-                AgentConfig(
-                    name="Claude AGAINST",
-                    role="AGAINST",
-                    model_provider="claude",
-                    model_name="haiku"
-                ),
-                AgentConfig(
-                    name="Claude SYNTHESIS",
-                    role="SYNTHESIS",
-                    model_provider="claude",
-                    model_name="haiku"
-                ),
-            ]
-        elif provider == 'gemini':
-            agents_config = [
-                AgentConfig(
-                    name="Gemini FOR",
-                    role="FOR",
-                    model_provider="gemini",
-                    model_name="flash"
-                ),
-                AgentConfig(
-                    name="Gemini AGAINST",
-                    role="AGAINST",
-                    model_provider="gemini",
-                    model_name="flash"
-                ),
-                AgentConfig(
-                    name="Gemini SYNTHESIS",
-                    role="SYNTHESIS",
-                    model_provider="gemini",
-                    model_name="flash"
-                ),
-            ]
-        else:  # mixed
-            agents_config = [
-                AgentConfig(
-                    name="Claude FOR",
-                    role="FOR",
-                    model_provider="claude",
-                    model_name="haiku"
-                ),
-                AgentConfig(
-                    name="Gemini AGAINST",
-                    role="AGAINST",
-                    model_provider="gemini",
-                    model_name="flash"
-                ),
-                AgentConfig(
-                    name="Claude SYNTHESIS",
-                    role="SYNTHESIS",
-                    model_provider="claude",
-                    model_name="haiku"
-                ),
-            ]
-
-        # Run debate
-        orchestrator = DebateOrchestrator()
-        debate = asyncio.run(orchestrator.run_debate(debate_topic, agents_config))
+        agents_config = _build_agents_config(provider)
+
+        # Run debate; the CLI always builds the configs in role order, so
+        # the 3-way fast path skips validation and sorting
+        orchestrator = _get_orchestrator()
+        debate = asyncio.run(orchestrator.run_debate_3way(debate_topic, *agents_config))
 
         # Format and display results
         debate_output = format_debate_for_display(debate)
@@ -123,18 +142,59 @@ def debate_command(topic, description, provider, output):
         raise click.ClickException(str(e))
 
 
+@cli_group.command(name='debate-batch')
+@click.option('--topics-file', required=True, type=click.Path(exists=True), help='JSONL file with one {"title": ..., "description": ...} topic per line')
+@click.option('--provider', default='claude', type=click.Choice(['claude', 'gemini', 'mixed']), help='AI provider: claude, gemini, or mixed')
+@click.option('--max-concurrency', default=8, type=int, help='Maximum debates in flight at once')
+def debate_batch_command(topics_file, provider, max_concurrency):
+    """Run debates for many topics concurrently"""
+    import asyncio
+    import json
+
+    try:
+        topics = []
+        with open(topics_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    topics.append(DebateTopic(**json.loads(line)))
+
+        if not topics:
+            raise click.ClickException(f"No topics found in {topics_file}")
+
+        click.echo(f"\n🔄 Running {len(topics)} debates (max {max_concurrency} concurrent)\n")
+
+        agents_config = _build_agents_config(provider)
+        orchestrator = _get_orchestrator()
+        debates = asyncio.run(
+            orchestrator.run_batch(topics, agents_config, max_concurrency=max_concurrency)
+        )
+
+        for debate in debates:
+            click.echo(f"✅ {debate.topic.title} — ID: {debate.debate_id}")
+
+        click.echo(f"\n📋 Completed {len(debates)} debates")
+
+    except click.ClickException:
+        raise
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        raise click.ClickException(str(e))
+
+
 @cli_group.group(name='debates')
 def debates_group():
     """Manage stored debates"""
     pass
 
 
-@debates_group.command(name='list')
-@click.option('--limit', default=10, type=int, help='Maximum debates to list')
-def debates_list_command(limit):
+# The list/view commands are the hot paths for short-lived CLI calls, so
+# they are registered as pre-built click.Command objects with explicit
+# parameter lists, skipping the decorator's signature introspection
+def _debates_list(limit):
     """List stored debates"""
     try:
-        orchestrator = DebateOrchestrator()
+        orchestrator = _get_orchestrator()
         debates = orchestrator.list_debates(limit=limit)
 
         if debates:
@@ -147,13 +207,10 @@ def debates_list_command(limit):
         raise click.ClickException(str(e))
 
 
-@debates_group.command(name='view')
-@click.argument('debate_id')
-@click.option('--format', 'output_format', default='text', type=click.Choice(['text', 'markdown']), help='Output format')
-def debates_view_command(debate_id, output_format):
+def _debates_view(debate_id, output_format):
     """View a specific debate"""
     try:
-        orchestrator = DebateOrchestrator()
+        orchestrator = _get_orchestrator()
         debate = orchestrator.get_debate(debate_id)
 
         if output_format == 'markdown':
@@ -171,29 +228,82 @@ def debates_view_command(debate_id, output_format):
         raise click.ClickException(str(e))
 
 
+debates_list_command = click.Command(
+    name='list',
+    callback=_debates_list,
+    help='List stored debates',
+    params=[
+        click.Option(['--limit'], default=10, type=int, help='Maximum debates to list'),
+    ],
+)
+debates_group.add_command(debates_list_command)
+
+debates_view_command = click.Command(
+    name='view',
+    callback=_debates_view,
+    help='View a specific debate',
+    params=[
+        click.Argument(['debate_id']),
+        click.Option(['--format', 'output_format'], default='text', type=click.Choice(['text', 'markdown']), help='Output format'),
+    ],
+)
+debates_group.add_command(debates_view_command)
+
+
+def _write_export_file(output, content):
+    """Write export content: encode once and push bytes through a raw fd,
+    skipping the TextIOWrapper layer for these single-shot writes"""
+    import os
+
+    out_dir = os.path.dirname(output) or '.'
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir, exist_ok=True)
+    data = content.encode('utf-8')
+    fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write fewer bytes than asked for large payloads
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+
+async def _export_async(debate, output, export_format):
+    """Format a debate and write it without blocking the event loop
+
+    The disk write is offloaded to a worker thread so callers running
+    inside an event loop (e.g. exporting during a batch) keep other
+    debates moving while the file hits disk.
+    """
+    import asyncio
+
+    # Format based on export format
+    if export_format == 'markdown':
+        content = format_debate_as_markdown(debate)
+    elif export_format == 'json':
+        # pydantic-core serializes straight to JSON, skipping the
+        # intermediate model_dump dict and stdlib json walk
+        content = debate.model_dump_json(indent=2)
+    else:  # text
+        content = format_debate_for_display(debate)
+
+    await asyncio.to_thread(_write_export_file, output, content)
+
+
 @debates_group.command(name='export')
 @click.argument('debate_id')
 @click.option('--output', required=True, help='Output file path')
 @click.option('--format', 'export_format', default='markdown', type=click.Choice(['markdown', 'json', 'text']), help='Export format')
 def debates_export_command(debate_id, output, export_format):
     """Export a debate to a file"""
+    import asyncio
+
     try:
-        orchestrator = DebateOrchestrator()
+        orchestrator = _get_orchestrator()
         debate = orchestrator.get_debate(debate_id)
 
-        # Format based on export format
-        if export_format == 'markdown':
-            content = format_debate_as_markdown(debate)
-        elif export_format == 'json':
-            import json
-            content = json.dumps(debate.model_dump(mode='json'), indent=2)
-        else:  # text
-            content = format_debate_for_display(debate)
-
-        # Write to file
-        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
-        with open(output, 'w') as f:
-            f.write(content)
+        asyncio.run(_export_async(debate, output, export_format))
 
         click.echo(f"✅ Debate exported to {output}")
 
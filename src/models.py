@@ -5,12 +5,44 @@ Defines the core data structures used throughout the application
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import List, Optional, Literal
 from datetime import datetime
-from uuid import uuid4
+import os
+
+
+# Short model names -> full model IDs, built once at import instead of
+# per AgentConfig instantiation
+_CLAUDE_MODELS = {
+    "haiku": "claude-haiku-4-5-20251001",
+    "sonnet": "claude-sonnet-4-5-20250929",
+    "opus": "claude-opus-4-5-20251101",
+}
+
+_GEMINI_MODELS = {
+    "flash-lite": "gemini-2.5-flash-lite",
+    "flash": "gemini-2.5-flash",
+    "pro": "gemini-2.5-pro",
+}
+
+
+def _fast_uuid() -> str:
+    """Random UUID4-format string straight from os.urandom
+
+    Skips uuid.uuid4()'s UUID object construction and __str__ walk; the
+    version and variant bits are set so the output is a valid UUID4.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 class AgentConfig(BaseModel):
     """Configuration for a debate agent (Claude or Gemini)"""
 
+    # Configs are built once and never mutated afterward; frozen lets
+    # Pydantic skip assignment validation and makes instances hashable
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., description="Agent name (e.g., 'Claude FOR')")
     role: Literal["FOR", "AGAINST", "SYNTHESIS"] = Field(..., description="Agent role in debate")
     model_provider: Literal["claude", "gemini"] = Field(..., description="AI provider")
@@ -19,31 +51,38 @@ class AgentConfig(BaseModel):
     temperature: float = Field(default=0.7, ge=0.0, le=1.0, description="Temperature for generation")
     max_tokens: int = Field(default=2000, gt=0, description="Max tokens to generate")
     timeout_seconds: int = Field(default=60, gt=0, description="CLI execution timeout")
+    request_timeout_seconds: Optional[float] = Field(
+        default=None, gt=0,
+        description="Per-attempt timeout; falls back to timeout_seconds when unset"
+    )
+    max_retries: int = Field(default=2, ge=0, description="Retries after a timed-out attempt")
 
     def model_post_init(self, __context):
         """Auto-generate model_id after model initialization"""
         if not self.model_id:
             # Map model names to full model IDs
+            # object.__setattr__ is Pydantic's documented escape hatch for
+            # filling derived fields on frozen models
             if self.model_provider == "claude":
-                model_map = {
-                    "haiku": "claude-haiku-4-5-20251001",
-                    "sonnet": "claude-sonnet-4-5-20250929",
-                    "opus": "claude-opus-4-5-20251101",
-                }
-                self.model_id = model_map.get(self.model_name, f"claude-{self.model_name}")
+                object.__setattr__(
+                    self, 'model_id',
+                    _CLAUDE_MODELS.get(self.model_name, f"claude-{self.model_name}")
+                )
 
             elif self.model_provider == "gemini":
-                model_map = {
-                    "flash-lite": "gemini-2.5-flash-lite",
-                    "flash": "gemini-2.5-flash",
-                    "pro": "gemini-2.5-pro",
-                }
-                self.model_id = model_map.get(self.model_name, f"gemini-{self.model_name}")
+                object.__setattr__(
+                    self, 'model_id',
+                    _GEMINI_MODELS.get(self.model_name, f"gemini-{self.model_name}")
+                )
 
 
 class DebateTopic(BaseModel):
     """Topic for a debate"""
 
+    # Topics are immutable once created; frozen also makes them hashable,
+    # so they can key caches keyed by topic
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     title: str = Field(..., description="Debate topic title")
     description: str = Field(..., description="Detailed description of the topic")
 
@@ -51,6 +90,9 @@ class DebateTopic(BaseModel):
 class AgentResponse(BaseModel):
     """Response from an agent execution"""
 
+    # Responses are write-once records; see AgentConfig for rationale
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     agent_name: str = Field(..., description="Name of the agent")
     role: Literal["FOR", "AGAINST", "SYNTHESIS"] = Field(..., description="Role of the agent")
     model_provider: str = Field(..., description="AI provider (claude/gemini)")
@@ -64,7 +106,9 @@ class AgentResponse(BaseModel):
 class DebateRecord(BaseModel):
     """Complete record of a debate"""
 
+    # Records are never mutated after the debate completes
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "debate_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -102,9 +146,25 @@ class DebateRecord(BaseModel):
         }
     )
 
-    debate_id: str = Field(default_factory=lambda: str(uuid4()), description="Unique debate ID")
+    debate_id: str = Field(default_factory=_fast_uuid, description="Unique debate ID")
     topic: DebateTopic = Field(..., description="Debate topic")
     agents_config: List[AgentConfig] = Field(default_factory=list, description="Agent configurations")
     agent_responses: List[AgentResponse] = Field(default_factory=list, description="Agent responses")
     total_execution_time_ms: float = Field(default=0, ge=0, description="Total execution time")
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
+
+    def execution_time_stats(self) -> tuple:
+        """Return (total, peak) of per-agent execution times in one pass
+
+        Fuses the sum and max that callers would otherwise compute with
+        two separate walks over agent_responses; (0, 0) when there are
+        no responses.
+        """
+        total = 0
+        peak = 0
+        for response in self.agent_responses:
+            elapsed = response.execution_time_ms
+            total += elapsed
+            if elapsed > peak:
+                peak = elapsed
+        return total, peak
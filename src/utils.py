@@ -1,89 +1,95 @@
 """
 Utility functions for formatting and helpers
 """
+import io
 from src.models import DebateRecord
 
+# Separator rules, built once instead of per formatter call
+_EQ_RULE = "=" * 70
+_DASH_RULE = "-" * 70
+
+# Per-response block for the markdown formatter; one format_map call
+# renders what used to be eight list appends
+_MD_RESPONSE_TPL = """## {index}. {role_name}
+
+**Agent:** {agent_name}
+
+**Model:** {model_name}
+
+**Execution Time:** {execution_time_ms:.1f}ms
+
+{response_text}
+
+"""
+
+_MD_ROLE_NAMES = {
+    "FOR": "Affirmative Argument",
+    "AGAINST": "Negative Argument",
+    "SYNTHESIS": "Synthesis",
+}
+
 
 def format_debate_for_display(debate: DebateRecord) -> str:
     """Format a debate record for terminal display"""
-    lines = []
+    # C-backed StringIO: append-only writes without list resizing or a
+    # final join copy
+    buf = io.StringIO()
+    w = buf.write
 
     # Header
-    lines.append("=" * 70)
-    lines.append(f"  DEBATE: {debate.topic.title}")
-    lines.append("=" * 70)
-    lines.append("")
+    w(f"{_EQ_RULE}\n  DEBATE: {debate.topic.title}\n{_EQ_RULE}\n\n")
 
     # Topic
-    lines.append("TOPIC DESCRIPTION:")
-    lines.append(debate.topic.description)
-    lines.append("")
+    w(f"TOPIC DESCRIPTION:\n{debate.topic.description}\n\n")
 
     # Responses
     for i, response in enumerate(debate.agent_responses, 1):
-        lines.append("-" * 70)
-        lines.append(f"{i}. {response.role} ARGUMENT")
-        lines.append(f"Agent: {response.agent_name}")
-        lines.append(f"Model: {response.model_name}")
-        lines.append(f"Execution Time: {response.execution_time_ms:.1f}ms")
-        lines.append("")
-        lines.append(response.response_text)
-        lines.append("")
+        w(f"{_DASH_RULE}\n"
+          f"{i}. {response.role} ARGUMENT\n"
+          f"Agent: {response.agent_name}\n"
+          f"Model: {response.model_name}\n"
+          f"Execution Time: {response.execution_time_ms:.1f}ms\n\n"
+          f"{response.response_text}\n\n")
 
     # Summary
-    lines.append("-" * 70)
-    lines.append("SUMMARY")
-    lines.append(f"Total Execution Time: {debate.total_execution_time_ms:.1f}ms")
-    lines.append(f"Created: {debate.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"Debate ID: {debate.debate_id}")
-    lines.append("=" * 70)
+    w(f"{_DASH_RULE}\n"
+      f"SUMMARY\n"
+      f"Total Execution Time: {debate.total_execution_time_ms:.1f}ms\n"
+      f"Created: {debate.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+      f"Debate ID: {debate.debate_id}\n"
+      f"{_EQ_RULE}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def format_debate_as_markdown(debate: DebateRecord) -> str:
     """Format a debate record as Markdown"""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
-    # Title
-    lines.append(f"# {debate.topic.title}")
-    lines.append("")
-
-    # Topic
-    lines.append("## Topic Description")
-    lines.append("")
-    lines.append(debate.topic.description)
-    lines.append("")
+    # Title and topic
+    w(f"# {debate.topic.title}\n\n"
+      f"## Topic Description\n\n"
+      f"{debate.topic.description}\n\n")
 
     # Responses
     for i, response in enumerate(debate.agent_responses, 1):
-        role_name = {
-            "FOR": "Affirmative Argument",
-            "AGAINST": "Negative Argument",
-            "SYNTHESIS": "Synthesis"
-        }.get(response.role, response.role)
-
-        lines.append(f"## {i}. {role_name}")
-        lines.append("")
-        lines.append(f"**Agent:** {response.agent_name}")
-        lines.append("")
-        lines.append(f"**Model:** {response.model_name}")
-        lines.append("")
-        lines.append(f"**Execution Time:** {response.execution_time_ms:.1f}ms")
-        lines.append("")
-        lines.append(response.response_text)
-        lines.append("")
+        w(_MD_RESPONSE_TPL.format_map({
+            "index": i,
+            "role_name": _MD_ROLE_NAMES.get(response.role, response.role),
+            "agent_name": response.agent_name,
+            "model_name": response.model_name,
+            "execution_time_ms": response.execution_time_ms,
+            "response_text": response.response_text,
+        }))
 
     # Metadata
-    lines.append("---")
-    lines.append("## Metadata")
-    lines.append("")
-    lines.append(f"- **Total Execution Time:** {debate.total_execution_time_ms:.1f}ms")
-    lines.append(f"- **Debate ID:** `{debate.debate_id}`")
-    lines.append(f"- **Created:** {debate.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+    w(f"---\n## Metadata\n\n"
+      f"- **Total Execution Time:** {debate.total_execution_time_ms:.1f}ms\n"
+      f"- **Debate ID:** `{debate.debate_id}`\n"
+      f"- **Created:** {debate.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def format_debates_list(debates: list) -> str:
@@ -91,19 +97,31 @@ def format_debates_list(debates: list) -> str:
     if not debates:
         return "No debates found."
 
-    lines = ["Stored Debates:"]
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("Stored Debates:\n\n")
 
     for i, debate in enumerate(debates, 1):
-        lines.append(f"{i}. {debate.topic.title}")
-        lines.append(f"   ID: {debate.debate_id}")
-        lines.append(f"   Created: {debate.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"   Agents: {len(debate.agent_responses)}")
-        lines.append("")
+        if i > 1:
+            w("\n")
+        w(f"{i}. {debate.topic.title}\n"
+          f"   ID: {debate.debate_id}\n"
+          f"   Created: {debate.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+          f"   Agents: {len(debate.agent_responses)}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def estimate_tokens(text: str) -> int:
     """Rough token estimation (approximately 4 chars per token)"""
     return len(text) // 4
+
+
+def estimate_tokens_batch(texts: list) -> list:
+    """Estimate tokens for many texts in one pass
+
+    Amortizes the per-call function overhead when estimating across a
+    whole debate, e.g. sum(estimate_tokens_batch(
+    [r.response_text for r in debate.agent_responses])).
+    """
+    return [len(text) // 4 for text in texts]
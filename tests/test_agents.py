@@ -8,10 +8,10 @@ from src.models import AgentConfig
 from src.agents import ClaudeAgent, GeminiAgent, create_agent
 
 
+@pytest.mark.live_cli
 class TestClaudeAgent:
     """Tests for ClaudeAgent with real Claude CLI"""
 
-    @pytest.mark.asyncio
     async def test_claude_agent_execution_haiku(self):
         """Test executing Claude Haiku agent"""
         config = AgentConfig(
@@ -34,7 +34,6 @@ class TestClaudeAgent:
         assert "4" in response.response_text  # Should contain the answer
         assert response.execution_time_ms > 0
 
-    @pytest.mark.asyncio
     async def test_claude_agent_execution_sonnet(self):
         """Test executing Claude Sonnet agent"""
         config = AgentConfig(
@@ -52,7 +51,6 @@ class TestClaudeAgent:
         assert "Paris" in response.response_text
         assert response.execution_time_ms > 0
 
-    @pytest.mark.asyncio
     async def test_claude_agent_timeout(self):
         """Test Claude agent with short timeout"""
         config = AgentConfig(
@@ -73,10 +71,10 @@ class TestClaudeAgent:
         assert response.execution_time_ms >= 0
 
 
+@pytest.mark.live_cli
 class TestGeminiAgent:
     """Tests for GeminiAgent with real Gemini CLI"""
 
-    @pytest.mark.asyncio
     async def test_gemini_agent_execution_flash_lite(self):
         """Test executing Gemini Flash-Lite agent"""
         config = AgentConfig(
@@ -101,7 +99,6 @@ class TestGeminiAgent:
         # Should NOT contain "Loaded cached credentials" (should be cleaned)
         assert "Loaded cached credentials" not in response.response_text
 
-    @pytest.mark.asyncio
     async def test_gemini_agent_execution_flash(self):
         """Test executing Gemini Flash agent"""
         config = AgentConfig(
@@ -119,7 +116,6 @@ class TestGeminiAgent:
         assert "Tokyo" in response.response_text
         assert response.execution_time_ms > 0
 
-    @pytest.mark.asyncio
     async def test_gemini_output_cleaning(self):
         """Test that Gemini output is properly cleaned"""
         config = AgentConfig(
@@ -176,17 +172,18 @@ class TestAgentFactory:
             model_provider="claude",  # Will create valid config
             model_name="sonnet"
         )
-        # Override provider to invalid (bypassing validation)
-        config.model_provider = "invalid"
+        # Copy with an invalid provider (model_copy skips validation;
+        # the config itself is frozen)
+        config = config.model_copy(update={"model_provider": "invalid"})
 
         with pytest.raises((ValueError, KeyError)):
             create_agent(config)
 
 
+@pytest.mark.live_cli
 class TestAgentResponseParsing:
     """Tests for response parsing and cleanup"""
 
-    @pytest.mark.asyncio
     async def test_claude_response_parsing(self):
         """Test Claude response is correctly parsed"""
         config = AgentConfig(
@@ -204,7 +201,6 @@ class TestAgentResponseParsing:
         # Should contain the response
         assert len(response.response_text) > 0
 
-    @pytest.mark.asyncio
     async def test_gemini_response_parsing_with_credentials(self):
         """Test Gemini response cleans credential messages"""
         config = AgentConfig(
@@ -222,10 +218,10 @@ class TestAgentResponseParsing:
         assert "Loaded cached credentials" not in response.response_text
 
 
+@pytest.mark.live_cli
 class TestAgentErrorHandling:
     """Tests for agent error handling"""
 
-    @pytest.mark.asyncio
     async def test_agent_cli_not_found(self):
         """Test handling when CLI is not found"""
         config = AgentConfig(
@@ -4,10 +4,7 @@ Tests Click commands for running and managing debates
 """
 import pytest
 from click.testing import CliRunner
-from src.cli import cli_group, debate_command, debates_list_command, debates_view_command, debates_export_command
-from src.models import DebateTopic, AgentConfig
-from src.orchestrator import DebateOrchestrator
-import asyncio
+from src.cli import cli_group, debate_command, debate_batch_command, debates_list_command, debates_view_command, debates_export_command
 
 
 @pytest.fixture
@@ -16,24 +13,15 @@ def cli_runner():
     return CliRunner()
 
 
-@pytest.fixture
-def sample_debate():
-    """Create a sample debate for testing"""
-    async def create():
-        topic = DebateTopic(
-            title="Test debate topic",
-            description="A test debate for CLI testing"
-        )
-        agents = [
-            AgentConfig(name="Agent 1", role="FOR", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="Agent 2", role="AGAINST", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="Agent 3", role="SYNTHESIS", model_provider="claude", model_name="haiku"),
-        ]
-        orchestrator = DebateOrchestrator()
-        debate = await orchestrator.run_debate(topic, agents)
-        return debate
+@pytest.fixture(scope="session")
+def sample_debate(shared_debate):
+    """Stored debate for the view/export tests
 
-    return asyncio.run(create())
+    Session-scoped alias of the suite-wide shared_debate (see conftest):
+    the CLI tests only need a stored record with a known id, so they
+    reuse the one debate already saved by the shared fixture.
+    """
+    return shared_debate
 
 
 class TestDebateCommand:
@@ -60,6 +48,7 @@ class TestDebateCommand:
         # Should fail because description is missing
         assert result.exit_code != 0
 
+    @pytest.mark.live_cli
     def test_debate_command_run_debate(self, cli_runner):
         """Test running a debate via CLI"""
         result = cli_runner.invoke(debate_command, [
@@ -72,6 +61,55 @@ class TestDebateCommand:
         assert 'Debate' in result.output or 'debate' in result.output.lower()
 
 
+class TestDebateBatchCommand:
+    """Tests for debate-batch command"""
+
+    def test_debate_batch_help(self, cli_runner):
+        """Test debate-batch command help"""
+        result = cli_runner.invoke(debate_batch_command, ['--help'])
+        assert result.exit_code == 0
+        assert '--topics-file' in result.output
+        assert '--max-concurrency' in result.output
+
+    def test_debate_batch_missing_file(self, cli_runner):
+        """Test batch with a topics file that does not exist"""
+        result = cli_runner.invoke(debate_batch_command, [
+            '--topics-file', '/no/such/topics.jsonl'
+        ])
+        assert result.exit_code != 0
+
+    def test_debate_batch_empty_file(self, cli_runner, tmp_path):
+        """Test batch with a topics file containing no topics"""
+        topics_file = tmp_path / "topics.jsonl"
+        topics_file.write_text("\n\n")
+
+        result = cli_runner.invoke(debate_batch_command, [
+            '--topics-file', str(topics_file)
+        ])
+        assert result.exit_code != 0
+        assert 'No topics found' in result.output
+
+    def test_debate_batch_runs_all_topics(self, cli_runner, tmp_path, mocked_claude):
+        """Test batch runs every topic and reports each debate ID"""
+        import json
+        topics = [
+            {"title": f"Batch topic {i}", "description": f"Description {i}"}
+            for i in range(3)
+        ]
+        topics_file = tmp_path / "topics.jsonl"
+        topics_file.write_text("\n".join(json.dumps(t) for t in topics) + "\n")
+
+        result = cli_runner.invoke(debate_batch_command, [
+            '--topics-file', str(topics_file),
+            '--max-concurrency', '2'
+        ])
+
+        assert result.exit_code == 0
+        for topic in topics:
+            assert topic["title"] in result.output
+        assert 'Completed 3 debates' in result.output
+
+
 class TestDebatesListCommand:
     """Tests for debates list command"""
 
@@ -172,8 +210,9 @@ class TestCLIGroup:
         """Test main CLI help"""
         result = cli_runner.invoke(cli_group, ['--help'])
         assert result.exit_code == 0
-        assert 'debate' in result.output.lower()
-        assert 'debates' in result.output.lower()
+        lowered = result.output.lower()
+        assert 'debate' in lowered
+        assert 'debates' in lowered
 
     def test_cli_no_command(self, cli_runner):
         """Test CLI with no command"""
@@ -4,15 +4,44 @@ Validates context-passing, prompt building, and complete orchestration
 """
 import pytest
 from src.models import DebateTopic, AgentConfig
-from src.orchestrator import DebateOrchestrator, build_for_prompt, build_against_prompt, build_synthesis_prompt
+from src.orchestrator import build_for_prompt, build_against_prompt, build_synthesis_prompt
 from src.agents import ClaudeAgent
-import asyncio
+
+
+# Role-phrasing vocabularies, built once at import so the prompt tests can
+# batch their substring checks with any()/all() over a lowercased prompt
+# instead of repeating `.lower()` per assertion
+FOR_TERMS = ("favor", "for")
+AGAINST_TERMS = ("counter", "against", "challenge")
+SYNTHESIS_TERMS = ("synthe", "balance", "both")
+
+# The standard claude/haiku triple, validated once at import; AgentConfig
+# is frozen so tests can share these instances freely
+STANDARD_AGENTS = (
+    AgentConfig(name="FOR", role="FOR", model_provider="claude", model_name="haiku"),
+    AgentConfig(name="AGAINST", role="AGAINST", model_provider="claude", model_name="haiku"),
+    AgentConfig(name="SYNTHESIS", role="SYNTHESIS", model_provider="claude", model_name="haiku"),
+)
+
+
+@pytest.fixture(scope="module")
+def ai_ethics_topic():
+    """Shared topic for the detailed prompt-building tests"""
+    return DebateTopic(
+        title="AI Ethics",
+        description="Should AI systems be regulated?"
+    )
+
+
+@pytest.fixture(scope="module")
+def ai_ethics_for_prompt(ai_ethics_topic):
+    """FOR prompt built once and reused across the prompt-structure tests"""
+    return build_for_prompt(ai_ethics_topic)
 
 
 class TestContextPassingFlow:
     """Test the actual context-passing flow"""
 
-    @pytest.mark.asyncio
     async def test_prompt_building_includes_context(self):
         """Test that prompts are built with actual context"""
         topic = DebateTopic(
@@ -22,29 +51,32 @@ class TestContextPassingFlow:
 
         # Build FOR prompt (no context)
         for_prompt = build_for_prompt(topic)
+        for_lower = for_prompt.lower()
         assert "Should AI have rights?" in for_prompt
-        assert "favor" in for_prompt.lower() or "for" in for_prompt.lower()
+        assert any(term in for_lower for term in FOR_TERMS)
         assert len(for_prompt) > 100
 
         # Build AGAINST prompt with FOR response
         for_response_text = "AI systems demonstrate sentience and deserve legal protection"
         against_prompt = build_against_prompt(topic, for_response_text)
+        against_lower = against_prompt.lower()
 
         # CRITICAL: Verify FOR response is IN the AGAINST prompt
         assert for_response_text in against_prompt, "AGAINST prompt must include FOR response"
         assert "Should AI have rights?" in against_prompt
-        assert "counter" in against_prompt.lower() or "against" in against_prompt.lower()
+        assert any(term in against_lower for term in AGAINST_TERMS)
 
         # Build SYNTHESIS prompt with both responses
         against_response_text = "However, AI systems lack consciousness and cannot have rights"
         synthesis_prompt = build_synthesis_prompt(topic, for_response_text, against_response_text)
+        synthesis_lower = synthesis_prompt.lower()
 
         # CRITICAL: Verify BOTH responses are IN the SYNTHESIS prompt
         assert for_response_text in synthesis_prompt, "SYNTHESIS prompt must include FOR response"
         assert against_response_text in synthesis_prompt, "SYNTHESIS prompt must include AGAINST response"
-        assert "synthe" in synthesis_prompt.lower() or "balance" in synthesis_prompt.lower()
+        assert any(term in synthesis_lower for term in SYNTHESIS_TERMS)
 
-    @pytest.mark.asyncio
+    @pytest.mark.live_cli
     async def test_actual_agent_execution_flow(self):
         """Test actual agent execution with real CLI"""
         topic = DebateTopic(
@@ -72,22 +104,9 @@ class TestContextPassingFlow:
         assert for_response.role == "FOR"
         assert for_response.agent_name == "Test FOR"
 
-    @pytest.mark.asyncio
-    async def test_complete_debate_flow_sequential(self):
+    def test_complete_debate_flow_sequential(self, shared_debate):
         """Test complete debate flow - agents actually run sequentially"""
-        topic = DebateTopic(
-            title="Is technology helpful?",  # Very simple topic
-            description="Discuss whether technology helps or harms society"
-        )
-
-        agents_config = [
-            AgentConfig(name="FOR", role="FOR", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="AGAINST", role="AGAINST", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="SYNTHESIS", role="SYNTHESIS", model_provider="claude", model_name="haiku"),
-        ]
-
-        orchestrator = DebateOrchestrator()
-        debate = await orchestrator.run_debate(topic, agents_config)
+        debate = shared_debate
 
         # Verify all responses exist
         assert len(debate.agent_responses) == 3, "Expected 3 agent responses"
@@ -119,55 +138,81 @@ class TestContextPassingFlow:
         assert synthesis_resp.execution_time_ms > 0, "SYNTHESIS execution time should be > 0"
 
 
+class TestConcurrentLegExecution:
+    """FOR and AGAINST legs can overlap when AGAINST runs blind
+
+    All three prompts are known up front with the mocked CLI, so the FOR
+    and AGAINST executes have no dependency edge and can be gathered;
+    the sequential row keeps a sanity check on the serialized ordering.
+    """
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    async def test_for_against_legs(self, concurrent, mocked_claude, ai_ethics_topic):
+        for_agent, against_agent, synthesis_agent = (
+            ClaudeAgent(config) for config in STANDARD_AGENTS)
+
+        for_prompt = build_for_prompt(ai_ethics_topic)
+        # Deterministic mock output stands in for the FOR text, so the
+        # AGAINST prompt can be built before FOR finishes
+        against_prompt = build_against_prompt(
+            ai_ethics_topic, "AI systems need regulation because they affect society")
+
+        if concurrent:
+            import asyncio
+
+            for_resp, against_resp = await asyncio.gather(
+                for_agent.execute(for_prompt),
+                against_agent.execute(against_prompt),
+            )
+        else:
+            for_resp = await for_agent.execute(for_prompt)
+            against_resp = await against_agent.execute(against_prompt)
+
+        synthesis_resp = await synthesis_agent.execute(build_synthesis_prompt(
+            ai_ethics_topic, for_resp.response_text, against_resp.response_text))
+
+        assert for_resp.success and against_resp.success and synthesis_resp.success
+        assert (for_resp.role, against_resp.role, synthesis_resp.role) == (
+            "FOR", "AGAINST", "SYNTHESIS")
+
+
 class TestPromptBuildingDetailedFlow:
     """Test that prompts are built correctly at each stage"""
 
-    def test_for_prompt_structure(self):
+    def test_for_prompt_structure(self, ai_ethics_for_prompt):
         """Test FOR prompt has correct structure"""
-        topic = DebateTopic(
-            title="AI Ethics",
-            description="Should AI systems be regulated?"
-        )
-
-        prompt = build_for_prompt(topic)
+        prompt = ai_ethics_for_prompt
+        lowered = prompt.lower()
 
         # Check structure
-        assert "AI Ethics" in prompt
-        assert "Should AI systems be regulated?" in prompt
-        assert "favor" in prompt.lower() or "for" in prompt.lower()
-        assert "argument" in prompt.lower()
+        assert all(s in prompt for s in ("AI Ethics", "Should AI systems be regulated?"))
+        assert any(term in lowered for term in FOR_TERMS)
+        assert "argument" in lowered
 
         # Should NOT include context (no previous responses)
         assert "AGAINST" not in prompt
         assert "SYNTHESIS" not in prompt
 
-    def test_against_prompt_includes_for_context(self):
+    def test_against_prompt_includes_for_context(self, ai_ethics_topic):
         """Test AGAINST prompt includes FOR context"""
-        topic = DebateTopic(
-            title="AI Ethics",
-            description="Should AI systems be regulated?"
-        )
         for_text = "AI systems need regulation because they affect society"
 
-        prompt = build_against_prompt(topic, for_text)
+        prompt = build_against_prompt(ai_ethics_topic, for_text)
 
         # Check it includes FOR response
         assert for_text in prompt, "AGAINST prompt must quote FOR argument"
         assert "AI Ethics" in prompt
 
         # Check it asks for counter-argument
-        assert "counter" in prompt.lower() or "against" in prompt.lower() or "challenge" in prompt.lower()
+        lowered = prompt.lower()
+        assert any(term in lowered for term in AGAINST_TERMS)
 
-    def test_synthesis_prompt_includes_all_context(self):
+    def test_synthesis_prompt_includes_all_context(self, ai_ethics_topic):
         """Test SYNTHESIS prompt includes both FOR and AGAINST"""
-        topic = DebateTopic(
-            title="AI Ethics",
-            description="Should AI be regulated?"
-        )
         for_text = "AI needs regulation"
         against_text = "AI shouldn't be overregulated"
 
-        prompt = build_synthesis_prompt(topic, for_text, against_text)
+        prompt = build_synthesis_prompt(ai_ethics_topic, for_text, against_text)
 
         # Check it includes both
         assert for_text in prompt, "SYNTHESIS must include FOR argument"
@@ -175,17 +220,16 @@ class TestPromptBuildingDetailedFlow:
         assert "AI Ethics" in prompt
 
         # Check it asks for synthesis
-        assert "synthe" in prompt.lower() or "balance" in prompt.lower() or "both" in prompt.lower()
+        lowered = prompt.lower()
+        assert any(term in lowered for term in SYNTHESIS_TERMS)
 
 
 class TestOrchestratorSequentialExecution:
     """Test that orchestrator executes agents sequentially with context-passing"""
 
-    @pytest.mark.asyncio
-    async def test_orchestrator_validates_agent_count(self):
+    async def test_orchestrator_validates_agent_count(self, orchestrator, trivial_topic):
         """Test that orchestrator validates exactly 3 agents"""
-        topic = DebateTopic(title="Test", description="Test")
-        orchestrator = DebateOrchestrator()
+        topic = trivial_topic
 
         # Test with 2 agents (should fail)
         agents_2 = [
@@ -193,25 +237,21 @@ class TestOrchestratorSequentialExecution:
             AgentConfig(name="2", role="AGAINST", model_provider="claude", model_name="haiku"),
         ]
 
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="exactly 3 agents"):
             await orchestrator.run_debate(topic, agents_2)
 
         # Test with 4 agents (should fail)
         agents_4 = [
-            AgentConfig(name="1", role="FOR", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="2", role="AGAINST", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="3", role="SYNTHESIS", model_provider="claude", model_name="haiku"),
+            *STANDARD_AGENTS,
             AgentConfig(name="4", role="FOR", model_provider="claude", model_name="haiku"),
         ]
 
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="exactly 3 agents"):
             await orchestrator.run_debate(topic, agents_4)
 
-    @pytest.mark.asyncio
-    async def test_orchestrator_validates_roles(self):
+    async def test_orchestrator_validates_roles(self, orchestrator, trivial_topic):
         """Test that orchestrator validates FOR, AGAINST, SYNTHESIS roles"""
-        topic = DebateTopic(title="Test", description="Test")
-        orchestrator = DebateOrchestrator()
+        topic = trivial_topic
 
         # Missing SYNTHESIS
         invalid_agents = [
@@ -220,60 +260,30 @@ class TestOrchestratorSequentialExecution:
             AgentConfig(name="3", role="FOR", model_provider="claude", model_name="haiku"),  # Duplicate FOR
         ]
 
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="roles FOR, AGAINST, SYNTHESIS"):
             await orchestrator.run_debate(topic, invalid_agents)
 
-    @pytest.mark.asyncio
-    async def test_debate_storage_integration(self):
+    def test_debate_storage_integration(self, shared_debate, shared_orchestrator):
         """Test that debate is stored after running"""
-        topic = DebateTopic(
-            title="Storage Test",
-            description="Test storage integration"
-        )
-
-        agents_config = [
-            AgentConfig(name="A", role="FOR", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="B", role="AGAINST", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="C", role="SYNTHESIS", model_provider="claude", model_name="haiku"),
-        ]
-
-        orchestrator = DebateOrchestrator()
-        debate = await orchestrator.run_debate(topic, agents_config)
-
         # Verify debate has ID
-        debate_id = debate.debate_id
+        debate_id = shared_debate.debate_id
         assert debate_id is not None
 
         # Retrieve the stored debate
-        retrieved = orchestrator.get_debate(debate_id)
+        retrieved = shared_orchestrator.get_debate(debate_id)
 
         # Verify it's the same debate
         assert retrieved.debate_id == debate_id
-        assert retrieved.topic.title == "Storage Test"
+        assert retrieved.topic.title == shared_debate.topic.title
         assert len(retrieved.agent_responses) == 3
 
 
 class TestResponseQuality:
     """Test that responses are actually meaningful"""
 
-    @pytest.mark.asyncio
-    async def test_responses_are_not_empty_templates(self):
+    def test_responses_are_not_empty_templates(self, shared_debate):
         """Test that responses are real agent output, not templates"""
-        topic = DebateTopic(
-            title="Python programming",
-            description="Is Python a good language?"
-        )
-
-        agents_config = [
-            AgentConfig(name="FOR", role="FOR", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="AGAINST", role="AGAINST", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="SYNTHESIS", role="SYNTHESIS", model_provider="claude", model_name="haiku"),
-        ]
-
-        orchestrator = DebateOrchestrator()
-        debate = await orchestrator.run_debate(topic, agents_config)
-
-        for response in debate.agent_responses:
+        for response in shared_debate.agent_responses:
             # Response should be substantial
             assert len(response.response_text) > 200, f"{response.role} response too short"
 
@@ -285,19 +295,9 @@ class TestResponseQuality:
             assert not response.response_text.startswith("Here is a debate")
             assert not response.response_text.startswith("I will")
 
-    @pytest.mark.asyncio
-    async def test_execution_times_are_reasonable(self):
+    def test_execution_times_are_reasonable(self, shared_debate):
         """Test that execution times are recorded realistically"""
-        topic = DebateTopic(title="Test", description="Test")
-
-        agents_config = [
-            AgentConfig(name="1", role="FOR", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="2", role="AGAINST", model_provider="claude", model_name="haiku"),
-            AgentConfig(name="3", role="SYNTHESIS", model_provider="claude", model_name="haiku"),
-        ]
-
-        orchestrator = DebateOrchestrator()
-        debate = await orchestrator.run_debate(topic, agents_config)
+        debate = shared_debate
 
         # Each response should have execution time > 0
         for response in debate.agent_responses:
@@ -313,11 +313,9 @@ class TestResponseQuality:
 class TestErrorHandlingRealFlow:
     """Test error handling in real execution"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_timeout_handling(self):
         """Test that timeouts are handled gracefully"""
-        topic = DebateTopic(title="Test", description="Test")
-
         # Create agent with very short timeout
         config = AgentConfig(
             name="Timeout Test",
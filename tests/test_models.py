@@ -3,7 +3,9 @@ Unit tests for Pydantic data models
 Test-driven development: Tests written first, then implementation
 """
 import pytest
+from contextlib import nullcontext
 from datetime import datetime
+from pydantic import ValidationError
 from src.models import AgentConfig, DebateTopic, AgentResponse, DebateRecord
 
 
@@ -61,45 +63,37 @@ class TestAgentConfig:
         assert config.max_tokens == 2000
         assert config.timeout_seconds == 60
 
-    def test_agent_config_invalid_role(self):
-        """Test that invalid role raises validation error"""
-        with pytest.raises(ValueError):
-            AgentConfig(
-                name="Invalid",
-                role="INVALID_ROLE",
-                model_provider="claude",
-                model_name="sonnet"
-            )
-
-    def test_agent_config_invalid_provider(self):
-        """Test that invalid provider raises validation error"""
-        with pytest.raises(ValueError):
-            AgentConfig(
-                name="Invalid",
-                role="FOR",
-                model_provider="invalid_provider",
-                model_name="sonnet"
-            )
-
-    def test_agent_config_temperature_bounds(self):
-        """Test that temperature must be between 0.0 and 1.0"""
-        with pytest.raises(ValueError):
-            AgentConfig(
-                name="Agent 1",
-                role="FOR",
-                model_provider="claude",
-                model_name="sonnet",
-                temperature=1.5  # Invalid: > 1.0
-            )
-
-        with pytest.raises(ValueError):
-            AgentConfig(
-                name="Agent 1",
-                role="FOR",
-                model_provider="claude",
-                model_name="sonnet",
-                temperature=-0.1  # Invalid: < 0.0
-            )
+    @pytest.mark.parametrize("overrides,failing_field", [
+        # Valid baseline
+        ({}, None),
+        # Boundary temperatures are allowed
+        ({"temperature": 0.0}, None),
+        ({"temperature": 1.0}, None),
+        # Invalid role / provider
+        ({"role": "INVALID_ROLE"}, "role"),
+        ({"model_provider": "invalid_provider"}, "model_provider"),
+        # Temperature out of [0.0, 1.0]
+        ({"temperature": 1.5}, "temperature"),
+        ({"temperature": -0.1}, "temperature"),
+    ])
+    def test_agent_config_validation(self, overrides, failing_field):
+        """Table-driven validation: each row is a field override and the
+        field expected to fail (None for valid rows). Matching on the
+        field name pins the failure to the intended validator."""
+        kwargs = {
+            "name": "Agent 1",
+            "role": "FOR",
+            "model_provider": "claude",
+            "model_name": "sonnet",
+            **overrides,
+        }
+
+        ctx = (
+            pytest.raises(ValidationError, match=failing_field)
+            if failing_field else nullcontext()
+        )
+        with ctx:
+            AgentConfig(**kwargs)
 
 
 class TestDebateTopic:
@@ -116,10 +110,10 @@ class TestDebateTopic:
 
     def test_debate_topic_required_fields(self):
         """Test that title and description are required"""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="description"):
             DebateTopic(title="Only title")
 
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="title"):
             DebateTopic(description="Only description")
 
 
@@ -161,7 +155,7 @@ class TestAgentResponse:
 
     def test_agent_response_invalid_role(self):
         """Test that invalid role raises validation error"""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValidationError, match="role"):
             AgentResponse(
                 agent_name="Agent 1",
                 role="INVALID",
@@ -0,0 +1,154 @@
+"""
+Tests for the storage backends
+Covers the JSON backend's index log (tombstones, legacy migration,
+corrupt-line tolerance) and the SQLite backend round-trip.
+"""
+import orjson
+import os
+import pytest
+from src.models import DebateTopic, AgentResponse, DebateRecord
+from src.storage import JSONStorageBackend, SQLiteStorageBackend, create_storage_backend
+
+
+def make_record(debate_id: str, title: str = "Test topic") -> DebateRecord:
+    """Minimal stored-shape record for storage round-trips"""
+    return DebateRecord(
+        debate_id=debate_id,
+        topic=DebateTopic(title=title, description="Test description"),
+        agent_responses=[
+            AgentResponse(
+                agent_name="FOR",
+                role="FOR",
+                model_provider="claude",
+                model_name="haiku",
+                response_text="argument",
+                execution_time_ms=1,
+                success=True,
+            ),
+        ],
+        total_execution_time_ms=1,
+    )
+
+
+class TestJSONStorageIndex:
+    """Tests for the append-only JSONL index log"""
+
+    def test_save_and_get_round_trip(self, tmp_path):
+        """Saved debate comes back equal by ID"""
+        backend = JSONStorageBackend(storage_dir=str(tmp_path))
+        record = make_record("debate-1")
+
+        backend.save_debate(record)
+        retrieved = backend.get_debate("debate-1")
+
+        assert retrieved.debate_id == "debate-1"
+        assert retrieved.topic.title == record.topic.title
+        assert retrieved.agent_responses[0].response_text == "argument"
+
+    def test_tombstone_filters_deleted_debate(self, tmp_path):
+        """delete_debate appends a tombstone and the listing drops the ID"""
+        backend = JSONStorageBackend(storage_dir=str(tmp_path))
+        backend.save_debate(make_record("debate-1"))
+        backend.save_debate(make_record("debate-2"))
+
+        assert backend.delete_debate("debate-1") is True
+
+        listed_ids = [d.debate_id for d in backend.list_debates(limit=10)]
+        assert listed_ids == ["debate-2"]
+        # The tombstone is a log line, not a rewrite: both saves and the
+        # delete are still present in the index file
+        with open(backend.index_file, 'rb') as f:
+            assert len(f.read().splitlines()) == 3
+
+    def test_delete_missing_debate_returns_false(self, tmp_path):
+        """Deleting an unknown ID is a no-op, not an error"""
+        backend = JSONStorageBackend(storage_dir=str(tmp_path))
+        assert backend.delete_debate("no-such-debate") is False
+
+    def test_legacy_index_migration(self, tmp_path):
+        """A legacy _index.json is converted to _index.jsonl once"""
+        legacy_entries = [
+            {"id": "debate-1", "created_at": "2025-01-01T00:00:00", "topic_title": "T1"},
+            {"id": "debate-2", "created_at": "2025-01-02T00:00:00", "topic_title": "T2"},
+        ]
+        legacy_path = tmp_path / "_index.json"
+        legacy_path.write_bytes(orjson.dumps(legacy_entries))
+
+        backend = JSONStorageBackend(storage_dir=str(tmp_path))
+
+        assert not legacy_path.exists()
+        assert os.path.exists(backend.index_file)
+        assert [e["id"] for e in backend._load_index()] == ["debate-1", "debate-2"]
+
+    def test_corrupt_trailing_line_is_skipped(self, tmp_path):
+        """A truncated append loses one entry, not the whole index"""
+        backend = JSONStorageBackend(storage_dir=str(tmp_path))
+        backend.save_debate(make_record("debate-1"))
+
+        # Simulate a crash mid-append: a partial JSON line at the tail
+        with open(backend.index_file, 'ab') as f:
+            f.write(b'{"id": "debate-2", "created')
+
+        listed_ids = [d.debate_id for d in backend.list_debates(limit=10)]
+        assert listed_ids == ["debate-1"]
+
+
+class TestSQLiteStorageBackend:
+    """Tests for the SQLite backend"""
+
+    @pytest.fixture
+    def backend(self, tmp_path):
+        return SQLiteStorageBackend(db_path=str(tmp_path / "debates.db"))
+
+    def test_save_and_get_round_trip(self, backend):
+        """Saved debate comes back equal by ID"""
+        record = make_record("debate-1")
+
+        assert backend.save_debate(record) == "debate-1"
+        retrieved = backend.get_debate("debate-1")
+
+        assert retrieved.debate_id == "debate-1"
+        assert retrieved.topic.title == record.topic.title
+        assert retrieved.agent_responses[0].response_text == "argument"
+
+    def test_get_missing_debate_raises(self, backend):
+        """Missing IDs follow the JSON backend's FileNotFoundError contract"""
+        with pytest.raises(FileNotFoundError, match="no-such-debate"):
+            backend.get_debate("no-such-debate")
+
+    def test_list_debates_most_recent_first(self, backend):
+        """Listing orders by created_at descending and honors the limit"""
+        from datetime import datetime
+        for day in (1, 2, 3):
+            record = make_record(f"debate-{day}").model_copy(
+                update={"created_at": datetime(2025, 1, day)}
+            )
+            backend.save_debate(record)
+
+        listed_ids = [d.debate_id for d in backend.list_debates(limit=2)]
+        assert listed_ids == ["debate-3", "debate-2"]
+
+    def test_delete_debate(self, backend):
+        """Delete returns True once, then False; the row is gone"""
+        backend.save_debate(make_record("debate-1"))
+
+        assert backend.delete_debate("debate-1") is True
+        assert backend.delete_debate("debate-1") is False
+        with pytest.raises(FileNotFoundError):
+            backend.get_debate("debate-1")
+
+
+class TestCreateStorageBackend:
+    """Tests for the storage backend factory"""
+
+    def test_creates_json_backend(self, tmp_path):
+        backend = create_storage_backend("json", storage_dir=str(tmp_path))
+        assert isinstance(backend, JSONStorageBackend)
+
+    def test_creates_sqlite_backend(self, tmp_path):
+        backend = create_storage_backend("sqlite", db_path=str(tmp_path / "d.db"))
+        assert isinstance(backend, SQLiteStorageBackend)
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown storage backend"):
+            create_storage_backend("redis")